@@ -0,0 +1,8 @@
+"""Pytest configuration for Jira CLI tests."""
+
+import sys
+from pathlib import Path
+
+# Make the src layout importable without an editable install
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
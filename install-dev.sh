@@ -57,7 +57,7 @@ python -m pip install --upgrade pip
 python -m pip install -r requirements.txt
 
 print_info "Installing development dependencies..."
-python -m pip install black isort flake8 pytest pytest-cov mypy
+python -m pip install black isort flake8 pytest pytest-cov pytest-xdist mypy
 
 print_info "Installing jira-cli in development mode..."
 python -m pip install -e .
@@ -0,0 +1,76 @@
+"""Line-oriented command runner for driving the CLI from test scripts.
+
+Reads one JSON array of CLI arguments per line on stdin, runs it against the
+Typer app in this process and writes one JSON object per line to stdout with
+the exit code and captured output. Importing the CLI once and reusing the
+process is much cheaper than starting an interpreter for every command.
+
+Usage:
+    python -m jira_cli.testrunner [PROG_NAME]
+
+Example:
+    $ echo '["config", "--setup-help"]' | python -m jira_cli.testrunner
+    {"exit_code": 0, "stdout": "...", "stderr": ""}
+"""
+
+import contextlib
+import io
+import json
+import sys
+import traceback
+from typing import List, Tuple
+
+
+def run_cli(args: List[str], prog_name: str = "jira-cli") -> Tuple[int, str, str]:
+    """Run the CLI in-process and capture its result.
+
+    Args:
+        args: Command line arguments, without the program name
+        prog_name: Program name shown in usage and help output
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
+    """
+    from .main import app
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    # Commands that prompt see end-of-input instead of reading the request
+    # stream, matching a subprocess run without a terminal
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        real_stdin, sys.stdin = sys.stdin, io.StringIO()
+        try:
+            app(args=args, prog_name=prog_name)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdin = real_stdin
+
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def main() -> None:
+    """Serve run requests from stdin until it is closed."""
+    prog_name = sys.argv[1] if len(sys.argv) > 1 else "jira-cli"
+    out = sys.stdout
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        exit_code, stdout, stderr = run_cli(json.loads(line), prog_name)
+        out.write(
+            json.dumps({"exit_code": exit_code, "stdout": stdout, "stderr": stderr})
+            + "\n"
+        )
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Print example ADF output for a few markdown snippets.
+
+Uses orjson for the JSON output when it is installed.
+
+Usage:
+    python -m jira_cli.tools.demo_adf
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils.markdown_to_adf import markdown_to_adf
+
+EXAMPLES = [
+    "# Epic: User Authentication\n\nImplement secure user authentication system.",
+    "## Story: Login Form\n\n- Create login UI\n- Add form validation\n- **Priority**: High",
+    "### Sub-task: Backend API\n\n```javascript\n// Login endpoint\napp.post('/login', (req, res) => {\n  // TODO: implement\n});\n```",
+]
+
+
+def _dumps_indented(obj) -> str:
+    """Serialize obj as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def demo_adf_output() -> None:
+    """Show example ADF output."""
+    print("\n" + "=" * 50)
+    print("DEMO: ADF Output Examples")
+    print("=" * 50)
+
+    for i, example in enumerate(EXAMPLES, 1):
+        print(f"\nExample {i}:")
+        print(f"Markdown:\n{example}")
+        print("\nADF Output:")
+        result = markdown_to_adf(example)
+        print(_dumps_indented(result))
+        print("-" * 30)
+
+
+if __name__ == "__main__":
+    demo_adf_output()
@@ -1,6 +1,7 @@
 """API utilities for Jira CLI."""
 
 import json
+import re
 from typing import Dict, Any, Optional, List
 import requests
 from requests.exceptions import RequestException, Timeout
@@ -8,6 +9,11 @@ from requests.exceptions import RequestException, Timeout
 from ..exceptions import JiraApiError, AuthenticationError
 from .auth import get_jira_credentials, get_auth_headers
 
+# Pattern to match @username, @email@domain.com, or @accountid:ACCOUNT_ID
+_MENTION_RE = re.compile(
+    r"@(?:accountid:([a-f0-9\-]{36})|([a-zA-Z0-9._-]+(?:@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})?|[a-zA-Z0-9._-]+))"
+)
+
 
 class JiraApiClient:
     """Jira API client."""
@@ -286,15 +292,10 @@ class JiraApiClient:
         Returns:
             List of ADF content nodes
         """
-        import re
-
         content_nodes = []
         last_end = 0
 
-        # Pattern to match @username, @email@domain.com, or @accountid:ACCOUNT_ID
-        mention_pattern = r"@(?:accountid:([a-f0-9\-]{36})|([a-zA-Z0-9._-]+(?:@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})?|[a-zA-Z0-9._-]+))"
-
-        for match in re.finditer(mention_pattern, text):
+        for match in _MENTION_RE.finditer(text):
             start, end = match.span()
 
             # Add text before mention
@@ -363,7 +364,6 @@ class JiraApiClient:
         Returns:
             Updated ADF document with mentions processed
         """
-        import re
         from copy import deepcopy
 
         doc = deepcopy(adf_doc)
@@ -374,11 +374,11 @@ class JiraApiClient:
 
             for node in content_list:
                 if node.get("type") == "text" and "text" in node:
-                    # Check if this text node contains mentions
+                    # Check if this text node contains mentions; every mention
+                    # starts with "@", so most nodes skip the regex entirely
                     text = node["text"]
-                    mention_pattern = r"@(?:accountid:([a-f0-9\-]{36})|([a-zA-Z0-9._-]+(?:@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})?|[a-zA-Z0-9._-]+))"
 
-                    if re.search(mention_pattern, text):
+                    if "@" in text and _MENTION_RE.search(text):
                         # Parse mentions and split into multiple nodes
                         parsed_nodes = self._parse_mentions_in_text(text)
                         # Preserve marks from original node
@@ -5,6 +5,13 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..exceptions import JiraCliError, ValidationError
 
+# Input formats checked by InputValidator, compiled once at import
+_ISSUE_KEY_RE = re.compile(r"^[A-Z][A-Z0-9]*-\d+$")
+_PROJECT_KEY_RE = re.compile(r"^[A-Z][A-Z0-9]*$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TIME_RE = re.compile(r"^(\d+[dwh]\s*)*\d*[mh]?$")
+
 
 class ErrorFormatter:
     """Formats error messages with helpful examples and suggestions."""
@@ -112,8 +119,7 @@ class InputValidator:
             raise ValidationError("Issue key is required")
 
         # Validate issue key format (PROJECT-NUMBER)
-        issue_key_pattern = r"^[A-Z][A-Z0-9]*-\d+$"
-        if not re.match(issue_key_pattern, issue_key.upper()):
+        if not _ISSUE_KEY_RE.match(issue_key.upper()):
             ErrorFormatter.print_formatted_error(
                 "Invalid Issue Key Format",
                 "Issue key must follow the format PROJECT-NUMBER.",
@@ -159,8 +165,7 @@ class InputValidator:
             raise ValidationError("Project key is required")
 
         # Validate project key format (uppercase letters and numbers only)
-        project_key_pattern = r"^[A-Z][A-Z0-9]*$"
-        if not re.match(project_key_pattern, project_key.upper()):
+        if not _PROJECT_KEY_RE.match(project_key.upper()):
             ErrorFormatter.print_formatted_error(
                 "Invalid Project Key Format",
                 "Project key must contain only uppercase letters and numbers, starting with a letter.",
@@ -203,8 +208,7 @@ class InputValidator:
             raise ValidationError("Email is required")
 
         # Basic email validation
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, email):
+        if not _EMAIL_RE.match(email):
             ErrorFormatter.print_formatted_error(
                 "Invalid Email Format",
                 "Email address format is not valid.",
@@ -244,8 +248,7 @@ class InputValidator:
             return date_str
 
         # Validate date format
-        date_pattern = r"^\d{4}-\d{2}-\d{2}$"
-        if not re.match(date_pattern, date_str):
+        if not _DATE_RE.match(date_str):
             ErrorFormatter.print_formatted_error(
                 "Invalid Date Format",
                 "Date must be in YYYY-MM-DD format.",
@@ -310,8 +313,7 @@ class InputValidator:
             raise ValidationError("Time spent is required")
 
         # Validate Jira time format
-        time_pattern = r"^(\d+[dwh]\s*)*\d*[mh]?$"
-        if not re.match(time_pattern, time_str.strip()):
+        if not _TIME_RE.match(time_str.strip()):
             ErrorFormatter.print_formatted_error(
                 "Invalid Time Format",
                 "Time must be in Jira time format using d (days), h (hours), m (minutes).",
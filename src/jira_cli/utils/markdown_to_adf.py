@@ -2,44 +2,149 @@
 
 import re
 from typing import Dict, List, Any, Optional
-import mistune
-from mistune import BaseRenderer
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Anything mistune might treat as markup: inline/block punctuation, setext
+# underlines, entities, escapes, control characters other than newline,
+# indented code, ordered list markers and hard breaks (two trailing spaces).
+# Whitespace other than space and newline (tabs, NBSP, Unicode spaces and
+# line separators) also goes to the parser, which strips it at line edges.
+# Inputs without a match are plain paragraphs separated by blank lines.
+_MD_META_RE = re.compile(
+    r"[#*_`\[\]|>~\-!<&\\+\x00-\x09\x0b-\x1f\x7f]|[^\S \n]|^ {4}|^ *(?:\d+[.)]|=)"
+    r"|  \n",
+    re.MULTILINE,
+)
+
+# One or more blank (or space-only) lines separating plain-text paragraphs
+_BLANK_LINES_RE = re.compile(r"\n(?: *\n)+")
+
+
+# Text prepended to task list items, indexed by their checked state
+_CHECKBOX_PREFIX = ("[] ", "[x] ")
+
+# Token types handled by ADFRenderer, resolved once per instance into a
+# dispatch table so render_token avoids getattr-based method lookup.
+_TOKEN_TYPES = (
+    "paragraph",
+    "heading",
+    "text",
+    "strong",
+    "emphasis",
+    "strikethrough",
+    "codespan",
+    "link",
+    "block_code",
+    "list",
+    "list_item",
+    "task_list_item",
+    "blockquote",
+    "block_quote",
+    "thematic_break",
+    "block_html",
+    "block_text",
+    "linebreak",
+    "softbreak",
+    "blank_line",
+    "table",
+    "table_head",
+    "table_body",
+    "table_row",
+    "table_cell",
+    "image",
+)
+
+
+def _apply_mark(
+    children: List[Dict[str, Any]],
+    mark_type: str,
+    attrs: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Return children with a mark of mark_type added to every text node.
+
+    Text nodes are copied rather than updated in place, and each one gets its
+    own mark dict, so nodes in the converted document never share state.
+    """
+    marked = []
+    for child in children:
+        if child.get("type") == "text":
+            mark = {"type": mark_type}
+            if attrs is not None:
+                mark["attrs"] = dict(attrs)
+            child = {**child, "marks": [*child.get("marks", ()), mark]}
+        marked.append(child)
+    return marked
+
+
+def _make_cell(cell_type: str, content: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a tableHeader/tableCell node wrapping content in a paragraph."""
+    return {
+        "type": cell_type,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": content if content else [{"type": "text", "text": ""}],
+            }
+        ],
+    }
 
 
-class ADFRenderer(BaseRenderer):
-    """Custom mistune renderer that outputs ADF format instead of HTML."""
+class ADFRenderer:
+    """Convert mistune AST tokens into ADF nodes."""
+
+    __slots__ = ("_dispatch", "_list_child_handlers", "_task_child_handlers")
 
     def __init__(self):
-        super().__init__()
-        self.current_content = []
+        self._dispatch = {name: getattr(self, name) for name in _TOKEN_TYPES}
+        # Child token handlers for list items; task items cannot nest lists
+        self._list_child_handlers = {
+            "block_text": self._li_paragraph,
+            "paragraph": self._li_paragraph,
+            "list": self._li_list,
+        }
+        self._task_child_handlers = {
+            "block_text": self._li_paragraph,
+            "paragraph": self._li_paragraph,
+        }
 
-    def finalize_data(self) -> Dict[str, Any]:
-        """Finalize and return ADF document structure."""
+    def finalize_data(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap rendered block nodes in an ADF document structure."""
         return {
             "type": "doc",
             "version": 1,
             "content": (
-                self.current_content
-                if self.current_content
+                content
+                if content
                 else [{"type": "paragraph", "content": [{"type": "text", "text": ""}]}]
             ),
         }
 
     def render_token(self, token: Dict[str, Any], state: Any) -> Any:
         """Render a single token."""
-        func = self._get_method(token["type"])
-        return func(token, state)
+        return self._dispatch.get(token["type"], self._fallback)(token, state)
+
+    def _fallback(self, token: Dict[str, Any], state: Any) -> None:
+        """Ignore token types without an ADF equivalent."""
+        return None
 
     def render_tokens(self, tokens: List[Dict[str, Any]], state: Any) -> List[Any]:
         """Render a list of tokens."""
         results = []
+        # Bind hot attributes to locals; handlers only ever return dicts,
+        # lists or None, so an exact type check is sufficient.
+        append = results.append
+        extend = results.extend
+        render = self.render_token
+        _list = list
         for token in tokens:
-            result = self.render_token(token, state)
-            if result is not None:
-                if isinstance(result, list):
-                    results.extend(result)
-                else:
-                    results.append(result)
+            result = render(token, state)
+            if result is None:
+                continue
+            if type(result) is _list:
+                extend(result)
+            else:
+                append(result)
         return results
 
     def render_children(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
@@ -51,21 +156,18 @@ class ADFRenderer(BaseRenderer):
     def paragraph(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle paragraph elements."""
         content = self.render_children(token, state)
-        adf_node = {"type": "paragraph", "content": content if content else [{"type": "text", "text": ""}]}
-        self.current_content.append(adf_node)
-        return adf_node
+        return {"type": "paragraph", "content": content if content else [{"type": "text", "text": ""}]}
 
     def heading(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle heading elements (h1-h6)."""
         content = self.render_children(token, state)
+        # mistune never emits a level below 1, so only cap the upper bound
         level = token.get("attrs", {}).get("level", 1)
-        adf_node = {
+        return {
             "type": "heading",
-            "attrs": {"level": min(max(level, 1), 6)},
+            "attrs": {"level": level if level < 7 else 6},
             "content": content if content else [{"type": "text", "text": ""}],
         }
-        self.current_content.append(adf_node)
-        return adf_node
 
     def text(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle plain text."""
@@ -73,48 +175,15 @@ class ADFRenderer(BaseRenderer):
 
     def strong(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
         """Handle bold/strong text."""
-        children = self.render_children(token, state)
-        # Apply strong mark to all text children
-        result = []
-        for child in children:
-            if child.get("type") == "text":
-                marks = child.get("marks", [])
-                marks.append({"type": "strong"})
-                child["marks"] = marks
-                result.append(child)
-            else:
-                result.append(child)
-        return result
+        return _apply_mark(self.render_children(token, state), "strong")
 
     def emphasis(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
         """Handle italic/emphasis text."""
-        children = self.render_children(token, state)
-        # Apply em mark to all text children
-        result = []
-        for child in children:
-            if child.get("type") == "text":
-                marks = child.get("marks", [])
-                marks.append({"type": "em"})
-                child["marks"] = marks
-                result.append(child)
-            else:
-                result.append(child)
-        return result
+        return _apply_mark(self.render_children(token, state), "em")
 
     def strikethrough(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
         """Handle strikethrough text."""
-        children = self.render_children(token, state)
-        # Apply strike mark to all text children
-        result = []
-        for child in children:
-            if child.get("type") == "text":
-                marks = child.get("marks", [])
-                marks.append({"type": "strike"})
-                child["marks"] = marks
-                result.append(child)
-            else:
-                result.append(child)
-        return result
+        return _apply_mark(self.render_children(token, state), "strike")
 
     def codespan(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle inline code."""
@@ -126,20 +195,10 @@ class ADFRenderer(BaseRenderer):
 
     def link(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
         """Handle links."""
-        children = self.render_children(token, state)
         url = token.get("attrs", {}).get("url", "")
-
-        # Apply link mark to all text children
-        result = []
-        for child in children:
-            if child.get("type") == "text":
-                marks = child.get("marks", [])
-                marks.append({"type": "link", "attrs": {"href": url}})
-                child["marks"] = marks
-                result.append(child)
-            else:
-                result.append(child)
-        return result
+        return _apply_mark(
+            self.render_children(token, state), "link", {"href": url}
+        )
 
     def block_code(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle code block elements."""
@@ -148,117 +207,91 @@ class ADFRenderer(BaseRenderer):
         if info:
             attrs["language"] = info.strip()
 
-        adf_node = {
+        return {
             "type": "codeBlock",
             "attrs": attrs,
             "content": [{"type": "text", "text": token.get("raw", "")}],
         }
-        self.current_content.append(adf_node)
-        return adf_node
 
     def list(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle list elements (ul/ol)."""
         ordered = token.get("attrs", {}).get("ordered", False)
-        children = token.get("children", [])
 
-        # Check if this is a task list (has task_list_item children)
-        is_task_list = any(child.get("type") == "task_list_item" for child in children)
-
-        if is_task_list:
-            # Convert task lists to regular bullet lists with [] / [x] syntax
-            # Note: Jira Cloud may not support taskList in all configurations
-            items = []
-            for child in children:
-                if child.get("type") == "task_list_item":
-                    checked = child.get("attrs", {}).get("checked", False)
-                    checkbox = "[x]" if checked else "[]"
-
-                    # Render child content
-                    child_content = []
-                    for grandchild in child.get("children", []):
-                        if grandchild.get("type") == "block_text":
-                            inline_content = self.render_children(grandchild, state)
-                            if inline_content:
-                                child_content.extend(inline_content)
-
-                    # Prepend checkbox to content
-                    final_content = [{"type": "text", "text": f"{checkbox} "}]
-                    final_content.extend(child_content)
-
-                    items.append({
-                        "type": "listItem",
-                        "content": [{"type": "paragraph", "content": final_content}]
-                    })
-
-            if items:
-                adf_node = {"type": "bulletList", "content": items}
-                self.current_content.append(adf_node)
-                return adf_node
-        else:
-            # Regular list
+        # Classify children in a single pass. Task items are rendered as we go;
+        # regular items are only rendered if the list turns out not to be a
+        # task list, since task lists drop any regular items they contain.
+        task_items = []
+        regular_children = []
+        render_children = self.render_children
+        for child in token.get("children", []):
+            child_type = child.get("type")
+            if child_type == "task_list_item":
+                # Convert task lists to regular bullet lists with [] / [x] syntax
+                # Note: Jira Cloud may not support taskList in all configurations
+                checked = child.get("attrs", {}).get("checked", False)
+
+                # Prepend checkbox to the item's inline content
+                final_content = [
+                    {"type": "text", "text": _CHECKBOX_PREFIX[bool(checked)]}
+                ]
+                for grandchild in child.get("children", []):
+                    if grandchild.get("type") == "block_text":
+                        final_content.extend(render_children(grandchild, state))
+
+                task_items.append({
+                    "type": "listItem",
+                    "content": [{"type": "paragraph", "content": final_content}]
+                })
+            elif child_type == "list_item":
+                regular_children.append(child)
+
+        if task_items:
+            return {"type": "bulletList", "content": task_items}
+
+        list_item = self.list_item
+        items = [list_item(child, state) for child in regular_children]
+        if items:
             list_type = "orderedList" if ordered else "bulletList"
-            items = []
-            for child in children:
-                if child.get("type") == "list_item":
-                    item_content = self.list_item(child, state)
-                    if item_content:
-                        items.append(item_content)
-
-            if items:
-                adf_node = {"type": list_type, "content": items}
-                self.current_content.append(adf_node)
-                return adf_node
+            return {"type": list_type, "content": items}
         return None
 
     def list_item(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle list item elements."""
         # Render children (which could be paragraphs, nested lists, etc.)
-        children = token.get("children", [])
         item_content = []
-
-        for child in children:
-            child_type = child.get("type")
-
-            if child_type == "block_text":
-                # Inline content directly in the list item
-                inline_content = self.render_children(child, state)
-                if inline_content:
-                    item_content.append({"type": "paragraph", "content": inline_content})
-
-            elif child_type == "paragraph":
-                # Paragraph in list item
-                para_content = self.render_children(child, state)
-                if para_content:
-                    item_content.append({"type": "paragraph", "content": para_content})
-
-            elif child_type == "list":
-                # Nested list
-                nested_list = self.list(child, state)
-                if nested_list:
-                    item_content.append(nested_list)
+        handlers = self._list_child_handlers
+        for child in token.get("children", []):
+            handler = handlers.get(child.get("type"))
+            if handler:
+                handler(child, state, item_content)
 
         return {"type": "listItem", "content": item_content if item_content else [{"type": "paragraph", "content": [{"type": "text", "text": ""}]}]}
 
+    def _li_paragraph(
+        self, child: Dict[str, Any], state: Any, item_content: List[Dict[str, Any]]
+    ) -> None:
+        """Add a list item's inline content (block_text or paragraph) as a paragraph."""
+        inline_content = self.render_children(child, state)
+        if inline_content:
+            item_content.append({"type": "paragraph", "content": inline_content})
+
+    def _li_list(
+        self, child: Dict[str, Any], state: Any, item_content: List[Dict[str, Any]]
+    ) -> None:
+        """Add a nested list to a list item."""
+        nested_list = self.list(child, state)
+        if nested_list:
+            item_content.append(nested_list)
+
     def task_list_item(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle task list item elements (checkboxes)."""
         checked = token.get("attrs", {}).get("checked", False)
-        children = token.get("children", [])
         item_content = []
-
-        for child in children:
-            child_type = child.get("type")
-
-            if child_type == "block_text":
-                # Inline content directly in the list item
-                inline_content = self.render_children(child, state)
-                if inline_content:
-                    item_content.append({"type": "paragraph", "content": inline_content})
-
-            elif child_type == "paragraph":
-                # Paragraph in list item
-                para_content = self.render_children(child, state)
-                if para_content:
-                    item_content.append({"type": "paragraph", "content": para_content})
+        handlers = self._task_child_handlers
+        for child in token.get("children", []):
+            handler = handlers.get(child.get("type"))
+            if handler:
+                handler(child, state, item_content)
 
         return {
             "type": "taskItem",
@@ -268,27 +301,9 @@ class ADFRenderer(BaseRenderer):
 
     def blockquote(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle blockquote elements."""
-        children = token.get("children", [])
-        content = []
-
-        for child in children:
-            # Store current_content temporarily
-            temp_content = self.current_content
-            self.current_content = []
-
-            # Render child (usually paragraphs)
-            self.render_token(child, state)
-
-            # Get rendered content
-            content.extend(self.current_content)
-
-            # Restore current_content
-            self.current_content = temp_content
-
+        content = self.render_tokens(token.get("children", []), state)
         if content:
-            adf_node = {"type": "blockquote", "content": content}
-            self.current_content.append(adf_node)
-            return adf_node
+            return {"type": "blockquote", "content": content}
         return None
 
     def block_quote(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
@@ -297,22 +312,18 @@ class ADFRenderer(BaseRenderer):
 
     def thematic_break(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle horizontal rules."""
-        adf_node = {"type": "rule"}
-        self.current_content.append(adf_node)
-        return adf_node
+        return {"type": "rule"}
 
     def block_html(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle raw HTML blocks (convert to text)."""
         # Strip HTML tags and treat as plain text
         html = token.get("raw", "")
-        text = re.sub(r"<[^>]+>", "", html)
-        if text.strip():
-            adf_node = {
+        text = _HTML_TAG_RE.sub("", html).strip()
+        if text:
+            return {
                 "type": "paragraph",
-                "content": [{"type": "text", "text": text.strip()}],
+                "content": [{"type": "text", "text": text}],
             }
-            self.current_content.append(adf_node)
-            return adf_node
         return None
 
     def block_text(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
@@ -352,28 +363,21 @@ class ADFRenderer(BaseRenderer):
                 rows.extend(body_rows)
 
         if rows:
-            adf_node = {
+            return {
                 "type": "table",
                 "attrs": {"isNumberColumnEnabled": False, "layout": "default"},
                 "content": rows
             }
-            self.current_content.append(adf_node)
-            return adf_node
         return None
 
     def table_head(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle table header row."""
-        children = token.get("children", [])
-        cells = []
-
-        for child in children:
-            if child.get("type") == "table_cell":
-                cell_content = self.render_children(child, state)
-                cells.append({
-                    "type": "tableHeader",
-                    "content": [{"type": "paragraph", "content": cell_content if cell_content else [{"type": "text", "text": ""}]}]
-                })
-
+        render_children = self.render_children
+        cells = [
+            _make_cell("tableHeader", render_children(child, state))
+            for child in token.get("children", [])
+            if child.get("type") == "table_cell"
+        ]
         return {"type": "tableRow", "content": cells}
 
     def table_body(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
@@ -391,17 +395,12 @@ class ADFRenderer(BaseRenderer):
 
     def table_row(self, token: Dict[str, Any], state: Any) -> Dict[str, Any]:
         """Handle table row."""
-        children = token.get("children", [])
-        cells = []
-
-        for child in children:
-            if child.get("type") == "table_cell":
-                cell_content = self.render_children(child, state)
-                cells.append({
-                    "type": "tableCell",
-                    "content": [{"type": "paragraph", "content": cell_content if cell_content else [{"type": "text", "text": ""}]}]
-                })
-
+        render_children = self.render_children
+        cells = [
+            _make_cell("tableCell", render_children(child, state))
+            for child in token.get("children", [])
+            if child.get("type") == "table_cell"
+        ]
         return {"type": "tableRow", "content": cells}
 
     def table_cell(self, token: Dict[str, Any], state: Any) -> List[Dict[str, Any]]:
@@ -437,6 +436,45 @@ class ADFRenderer(BaseRenderer):
         }
 
 
+# Markdown parser producing mistune's AST tokens and the renderer converting
+# them, shared by all threads; the renderer keeps no per-document state.
+# The parser is created on first use so that commands which never convert
+# markdown don't pay for importing mistune.
+_AST_PARSER = None
+_RENDERER = ADFRenderer()
+
+
+def _get_parser() -> Any:
+    """Return the shared AST-mode mistune parser, creating it if needed."""
+    global _AST_PARSER
+    if _AST_PARSER is None:
+        import mistune
+
+        # Enable plugins for extended markdown features
+        _AST_PARSER = mistune.create_markdown(
+            renderer=None,
+            plugins=['strikethrough', 'table', 'task_lists']
+        )
+    return _AST_PARSER
+
+
+def _plain_text_paragraphs(text: str) -> List[Dict[str, Any]]:
+    """Build ADF paragraphs for text already known to contain no markdown.
+
+    Mirrors what mistune produces for such input: blank lines separate
+    paragraphs, and single newlines become soft breaks (a space text node).
+    """
+    paragraphs = []
+    for block in _BLANK_LINES_RE.split(text.strip(" \n")):
+        content = []
+        for line in block.split("\n"):
+            if content:
+                content.append({"type": "text", "text": " "})
+            content.append({"type": "text", "text": line.strip(" ")})
+        paragraphs.append({"type": "paragraph", "content": content})
+    return paragraphs
+
+
 def markdown_to_adf(markdown_text: str) -> Dict[str, Any]:
     """Convert markdown text to Atlassian Document Format (ADF).
 
@@ -460,21 +498,18 @@ def markdown_to_adf(markdown_text: str) -> Dict[str, Any]:
             ],
         }
 
-    # Create custom renderer
-    renderer = ADFRenderer()
-
-    # Create markdown parser with custom renderer and plugins
-    # Enable plugins for extended markdown features
-    markdown = mistune.create_markdown(
-        renderer=renderer,
-        plugins=['strikethrough', 'table', 'task_lists']
-    )
+    # Short plain-text comments ("LGTM", "I agree") skip the parser entirely
+    if len(markdown_text) < 256 and not _MD_META_RE.search(markdown_text):
+        return {
+            "type": "doc",
+            "version": 1,
+            "content": _plain_text_paragraphs(markdown_text),
+        }
 
-    # Parse markdown (this will populate the renderer's content)
-    markdown(markdown_text)
+    tokens, state = _get_parser().parse(markdown_text)
 
-    # Get final ADF structure
-    return renderer.finalize_data()
+    # Render the top-level block tokens into ADF nodes
+    return _RENDERER.finalize_data(_RENDERER.render_tokens(tokens, state))
 
 
 def text_to_adf(text: str, is_markdown: bool = True) -> Dict[str, Any]:
@@ -505,13 +540,14 @@ def text_to_adf(text: str, is_markdown: bool = True) -> Dict[str, Any]:
 
 def create_heading_adf(text: str, level: int = 1) -> Dict[str, Any]:
     """Create ADF heading node."""
+    level = 1 if level < 1 else 6 if level > 6 else level
     return {
         "type": "doc",
         "version": 1,
         "content": [
             {
                 "type": "heading",
-                "attrs": {"level": min(max(level, 1), 6)},
+                "attrs": {"level": level},
                 "content": [{"type": "text", "text": text}],
             }
         ],
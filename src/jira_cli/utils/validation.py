@@ -1,64 +1,160 @@
 """Validation decorators and utilities for Jira CLI commands."""
 
 import functools
-from typing import Any, Callable, List, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+import typer
 
 from .error_handling import InputValidator, ValidationError, handle_api_error
 from ..exceptions import JiraCliError
 
+# Distinguishes an absent keyword argument from one explicitly passed as None
+_MISSING = object()
+
+# Validators bound once so wrappers skip the class attribute lookup per call.
+# Successful results are memoized on (value, ..., context) so bulk commands
+# repeating the same keys skip the regex work; failures raise and are never
+# cached, so their error output is still printed every time. Required checks
+# accept arbitrary (possibly unhashable) values and stay uncached, and choices
+# are checked against a precomputed frozenset instead (see _v_choice).
+_cached = functools.lru_cache(maxsize=1024)
+_v_issue = _cached(InputValidator.validate_issue_key)
+_v_project = _cached(InputValidator.validate_project_key)
+_v_email = _cached(InputValidator.validate_email)
+_v_date = _cached(InputValidator.validate_date_format)
+_v_time = _cached(InputValidator.validate_time_format)
+_v_jql = _cached(InputValidator.validate_jql_query)
+_v_required = InputValidator.validate_required_parameter
+
+
+def _v_choice(
+    value: str,
+    choice_set: frozenset,
+    valid_choices: Tuple[str, ...],
+    parameter_name: str,
+    command_context: str = "",
+) -> str:
+    """Accept value if it is in choice_set, otherwise report it as invalid.
 
-def validate_issue_key(param_name: str = "issue_key", command_context: str = ""):
-    """Decorator to validate issue key parameter.
+    valid_choices keeps the declared order for the error message.
+    """
+    if value in choice_set:
+        return value
+    return InputValidator.validate_choice_parameter(
+        value, valid_choices, parameter_name, command_context
+    )
+
+
+def _choice_entry(param_name: str, valid_choices: List[str]) -> Tuple:
+    """Build the _ValidationPlan entry for a choice parameter."""
+    return (
+        param_name,
+        _v_choice,
+        (frozenset(valid_choices), tuple(valid_choices), param_name),
+        False,
+    )
+
+
+def _thin_wraps(wrapper: Callable, func: Callable) -> Callable:
+    """Copy the attributes of func that Typer relies on onto wrapper.
+
+    Lighter than functools.wraps: the name, docstring and annotations drive
+    Typer's command name, help text and option types, and __wrapped__ lets
+    inspect.signature see the original parameters. func.__dict__ is not
+    merged into the wrapper.
+    """
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__annotations__ = func.__annotations__
+    wrapper.__wrapped__ = func
+    return wrapper
 
-    Args:
-        param_name: Name of the parameter containing the issue key
-        command_context: Command context for error messages
+
+class _SilentValidationError(JiraCliError):
+    """Validation failure whose details the validator has already printed."""
+
+    def __init__(self) -> None:
+        super().__init__("Validation failed")
+
+
+@dataclass(frozen=True)
+class _ValidationPlan:
+    """Ordered parameter validators for one decorated command.
+
+    Each entry is (param, validator, extra_args, always). The validator is
+    called as validator(value, *extra_args, context) and its result replaces
+    the keyword argument. Falsy values are skipped unless always is set.
+    """
+
+    entries: Tuple[Tuple[str, Callable, tuple, bool], ...]
+    params: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "params", frozenset(e[0] for e in self.entries))
+
+    def apply(self, kwargs: Dict[str, Any], context: str) -> None:
+        """Validate and normalize kwargs in place."""
+        # Nothing to do for calls that pass none of the planned parameters
+        # by keyword (e.g. positional calls or commands without validation)
+        if self.params.isdisjoint(kwargs):
+            return
+        for param, validate, extra, always in self.entries:
+            value = kwargs.get(param, _MISSING)
+            if value is not _MISSING and (always or value):
+                kwargs[param] = validate(value, *extra, context)
+
+
+def _validate_params(plan: _ValidationPlan, command_context: str) -> Callable:
+    """Build a decorator that applies plan before calling the command.
+
+    Shared by the single-parameter decorators, which report validation
+    failures as a JiraCliError("Validation failed") that handle_errors and
+    validate_command exit on without printing anything further.
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        context = (
+            command_context or f"{func.__module__.rpartition('.')[2]} {func.__name__}"
+        )
+        apply = plan.apply
+
         def wrapper(*args, **kwargs):
             try:
-                if param_name in kwargs:
-                    kwargs[param_name] = InputValidator.validate_issue_key(
-                        kwargs[param_name],
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
+                apply(kwargs, context)
                 return func(*args, **kwargs)
             except ValidationError:
-                raise JiraCliError("Validation failed")
+                raise _SilentValidationError()
 
-        return wrapper
+        return _thin_wraps(wrapper, func)
 
     return decorator
 
 
-def validate_project_key(param_name: str = "project_key", command_context: str = ""):
-    """Decorator to validate project key parameter.
+def validate_issue_key(param_name: str = "issue_key", command_context: str = ""):
+    """Decorator to validate issue key parameter.
 
     Args:
-        param_name: Name of the parameter containing the project key
+        param_name: Name of the parameter containing the issue key
         command_context: Command context for error messages
     """
+    return _validate_params(
+        _ValidationPlan(((param_name, _v_issue, (), True),)), command_context
+    )
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                if param_name in kwargs:
-                    kwargs[param_name] = InputValidator.validate_project_key(
-                        kwargs[param_name],
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
 
-        return wrapper
+def validate_project_key(param_name: str = "project_key", command_context: str = ""):
+    """Decorator to validate project key parameter.
 
-    return decorator
+    Args:
+        param_name: Name of the parameter containing the project key
+        command_context: Command context for error messages
+    """
+    return _validate_params(
+        _ValidationPlan(((param_name, _v_project, (), True),)), command_context
+    )
 
 
 def validate_email(param_name: str = "email", command_context: str = ""):
@@ -68,24 +164,9 @@ def validate_email(param_name: str = "email", command_context: str = ""):
         param_name: Name of the parameter containing the email
         command_context: Command context for error messages
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                if param_name in kwargs and kwargs[param_name]:
-                    kwargs[param_name] = InputValidator.validate_email(
-                        kwargs[param_name],
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
-
-        return wrapper
-
-    return decorator
+    return _validate_params(
+        _ValidationPlan(((param_name, _v_email, (), False),)), command_context
+    )
 
 
 def validate_date(param_name: str = "date", command_context: str = ""):
@@ -95,24 +176,9 @@ def validate_date(param_name: str = "date", command_context: str = ""):
         param_name: Name of the parameter containing the date
         command_context: Command context for error messages
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                if param_name in kwargs and kwargs[param_name]:
-                    kwargs[param_name] = InputValidator.validate_date_format(
-                        kwargs[param_name],
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
-
-        return wrapper
-
-    return decorator
+    return _validate_params(
+        _ValidationPlan(((param_name, _v_date, (), False),)), command_context
+    )
 
 
 def validate_time_spent(param_name: str = "time_spent", command_context: str = ""):
@@ -122,24 +188,9 @@ def validate_time_spent(param_name: str = "time_spent", command_context: str = "
         param_name: Name of the parameter containing the time spent
         command_context: Command context for error messages
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                if param_name in kwargs and kwargs[param_name]:
-                    kwargs[param_name] = InputValidator.validate_time_format(
-                        kwargs[param_name],
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
-
-        return wrapper
-
-    return decorator
+    return _validate_params(
+        _ValidationPlan(((param_name, _v_time, (), False),)), command_context
+    )
 
 
 def validate_jql(param_name: str = "jql", command_context: str = ""):
@@ -149,24 +200,9 @@ def validate_jql(param_name: str = "jql", command_context: str = ""):
         param_name: Name of the parameter containing the JQL query
         command_context: Command context for error messages
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                if param_name in kwargs:
-                    kwargs[param_name] = InputValidator.validate_jql_query(
-                        kwargs[param_name],
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
-
-        return wrapper
-
-    return decorator
+    return _validate_params(
+        _ValidationPlan(((param_name, _v_jql, (), True),)), command_context
+    )
 
 
 def validate_required(param_names: Union[str, List[str]], command_context: str = ""):
@@ -179,25 +215,12 @@ def validate_required(param_names: Union[str, List[str]], command_context: str =
     if isinstance(param_names, str):
         param_names = [param_names]
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                for param_name in param_names:
-                    if param_name in kwargs:
-                        kwargs[param_name] = InputValidator.validate_required_parameter(
-                            kwargs[param_name],
-                            param_name,
-                            command_context
-                            or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                        )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
-
-        return wrapper
-
-    return decorator
+    return _validate_params(
+        _ValidationPlan(
+            tuple((name, _v_required, (name,), True) for name in param_names)
+        ),
+        command_context,
+    )
 
 
 def validate_choice(
@@ -210,26 +233,9 @@ def validate_choice(
         valid_choices: List of valid choice values
         command_context: Command context for error messages
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                if param_name in kwargs and kwargs[param_name]:
-                    kwargs[param_name] = InputValidator.validate_choice_parameter(
-                        kwargs[param_name],
-                        valid_choices,
-                        param_name,
-                        command_context
-                        or f"{func.__module__.split('.')[-1]} {func.__name__}",
-                    )
-                return func(*args, **kwargs)
-            except ValidationError:
-                raise JiraCliError("Validation failed")
-
-        return wrapper
-
-    return decorator
+    return _validate_params(
+        _ValidationPlan((_choice_entry(param_name, valid_choices),)), command_context
+    )
 
 
 def validate_project_issue_type(
@@ -320,28 +326,22 @@ def handle_errors(command_context: str = ""):
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        context = command_context or func.__module__.rpartition(".")[2]
+
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
+            except _SilentValidationError:
+                raise typer.Exit(1)
             except JiraCliError as e:
                 # JiraCliError includes ValidationError - these are already formatted
-                if str(e) != "Validation failed":
-                    handle_api_error(
-                        e, command_context or f"{func.__module__.split('.')[-1]}"
-                    )
-                import typer
-
+                handle_api_error(e, context)
                 raise typer.Exit(1)
             except Exception as e:
-                handle_api_error(
-                    e, command_context or f"{func.__module__.split('.')[-1]}"
-                )
-                import typer
-
+                handle_api_error(e, context)
                 raise typer.Exit(1)
 
-        return wrapper
+        return _thin_wraps(wrapper, func)
 
     return decorator
 
@@ -374,101 +374,44 @@ def validate_command(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        context = (
+            command_context or f"{func.__module__.rpartition('.')[2]} {func.__name__}"
+        )
+
+        # Flatten the parameter groups into a single validation plan so the
+        # wrapper only walks one sequence per call. Group order is preserved.
+        entries = []
+        for params, validate in (
+            (issue_key_params, _v_issue),
+            (project_key_params, _v_project),
+            (email_params, _v_email),
+            (date_params, _v_date),
+            (time_params, _v_time),
+            (jql_params, _v_jql),
+        ):
+            for param in params or ():
+                entries.append((param, validate, (), False))
+        # Required parameters are validated even when falsy
+        for param in required_params or ():
+            entries.append((param, _v_required, (param,), True))
+        for param_name, valid_choices in choice_params or ():
+            entries.append(_choice_entry(param_name, valid_choices))
+        apply = _ValidationPlan(tuple(entries)).apply
+
         def wrapper(*args, **kwargs):
             try:
-                context = (
-                    command_context
-                    or f"{func.__module__.split('.')[-1]} {func.__name__}"
-                )
-
-                # Validate issue keys
-                if issue_key_params:
-                    for param in issue_key_params:
-                        if param in kwargs and kwargs[param]:
-                            kwargs[param] = InputValidator.validate_issue_key(
-                                kwargs[param], context
-                            )
-
-                # Validate project keys
-                if project_key_params:
-                    for param in project_key_params:
-                        if param in kwargs and kwargs[param]:
-                            kwargs[param] = InputValidator.validate_project_key(
-                                kwargs[param], context
-                            )
-
-                # Validate emails
-                if email_params:
-                    for param in email_params:
-                        if param in kwargs and kwargs[param]:
-                            kwargs[param] = InputValidator.validate_email(
-                                kwargs[param], context
-                            )
-
-                # Validate dates
-                if date_params:
-                    for param in date_params:
-                        if param in kwargs and kwargs[param]:
-                            kwargs[param] = InputValidator.validate_date_format(
-                                kwargs[param], context
-                            )
-
-                # Validate time values
-                if time_params:
-                    for param in time_params:
-                        if param in kwargs and kwargs[param]:
-                            kwargs[param] = InputValidator.validate_time_format(
-                                kwargs[param], context
-                            )
-
-                # Validate JQL queries
-                if jql_params:
-                    for param in jql_params:
-                        if param in kwargs and kwargs[param]:
-                            kwargs[param] = InputValidator.validate_jql_query(
-                                kwargs[param], context
-                            )
-
-                # Validate required parameters
-                if required_params:
-                    for param in required_params:
-                        if param in kwargs:
-                            kwargs[param] = InputValidator.validate_required_parameter(
-                                kwargs[param], param, context
-                            )
-
-                # Validate choice parameters
-                if choice_params:
-                    for param_name, valid_choices in choice_params:
-                        if param_name in kwargs and kwargs[param_name]:
-                            kwargs[param_name] = (
-                                InputValidator.validate_choice_parameter(
-                                    kwargs[param_name],
-                                    valid_choices,
-                                    param_name,
-                                    context,
-                                )
-                            )
-
+                apply(kwargs, context)
                 return func(*args, **kwargs)
 
-            except ValidationError:
-                import typer
-
+            except (ValidationError, _SilentValidationError):
                 raise typer.Exit(1)
             except JiraCliError as e:
-                if str(e) != "Validation failed":
-                    handle_api_error(e, context)
-                import typer
-
+                handle_api_error(e, context)
                 raise typer.Exit(1)
             except Exception as e:
                 handle_api_error(e, context)
-                import typer
-
                 raise typer.Exit(1)
 
-        return wrapper
+        return _thin_wraps(wrapper, func)
 
     return decorator
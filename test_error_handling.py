@@ -1,13 +1,56 @@
 #!/usr/bin/env python3
 """Test script to validate enhanced error handling in Jira CLI."""
 
+import io
+import json
 import subprocess
 import sys
 import os
-from typing import List, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, TextIO, Tuple
+
+# CLI invocations that can be served by a long-lived jira_cli.testrunner
+# process instead of starting a new interpreter for each command
+CLI_COMMAND = ["python", "-m", "jira_cli.main"]
+
+# One runner process per worker thread, created on first use
+_runner_local = threading.local()
+_runner_processes: List[subprocess.Popen] = []
+
+def get_runner() -> subprocess.Popen:
+    """Return this thread's test runner process, starting it if needed."""
+    runner = getattr(_runner_local, "process", None)
+    if runner is None:
+        runner = subprocess.Popen(
+            ["python", "-m", "jira_cli.testrunner", " ".join(CLI_COMMAND)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        _runner_local.process = runner
+        _runner_processes.append(runner)
+    return runner
+
+def close_runners():
+    """Shut down all test runner processes."""
+    for runner in _runner_processes:
+        runner.stdin.close()
+        runner.wait()
+    _runner_processes.clear()
 
 def run_command(command: List[str]) -> Tuple[int, str, str]:
     """Run a command and return exit code, stdout, stderr."""
+    if command[:len(CLI_COMMAND)] == CLI_COMMAND:
+        runner = get_runner()
+        runner.stdin.write(json.dumps(command[len(CLI_COMMAND):]) + "\n")
+        runner.stdin.flush()
+        response = runner.stdout.readline()
+        if not response:
+            return 1, "", "Test runner exited unexpectedly"
+        result = json.loads(response)
+        return result["exit_code"], result["stdout"], result["stderr"]
+
     try:
         result = subprocess.run(
             command,
@@ -21,21 +64,22 @@ def run_command(command: List[str]) -> Tuple[int, str, str]:
     except Exception as e:
         return 1, "", str(e)
 
-def test_error_scenario(description: str, command: List[str], expected_keywords: List[str] = None):
+def test_error_scenario(description: str, command: List[str], expected_keywords: List[str] = None, out: Optional[TextIO] = None):
     """Test an error scenario and validate the error message."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {description}")
-    print(f"Command: {' '.join(command)}")
-    print(f"{'='*60}")
+    out = out or sys.stdout
+    print(f"\n{'='*60}", file=out)
+    print(f"Testing: {description}", file=out)
+    print(f"Command: {' '.join(command)}", file=out)
+    print(f"{'='*60}", file=out)
     
     exit_code, stdout, stderr = run_command(command)
     output = stdout + stderr
     
-    print(f"Exit code: {exit_code}")
+    print(f"Exit code: {exit_code}", file=out)
     if output.strip():
-        print(f"Output:\n{output}")
+        print(f"Output:\n{output}", file=out)
     else:
-        print("No output captured")
+        print("No output captured", file=out)
     
     # Check for expected keywords in output
     if expected_keywords:
@@ -48,12 +92,26 @@ def test_error_scenario(description: str, command: List[str], expected_keywords:
                 missing_keywords.append(keyword)
         
         if found_keywords:
-            print(f"✓ Found expected keywords: {', '.join(found_keywords)}")
+            print(f"✓ Found expected keywords: {', '.join(found_keywords)}", file=out)
         if missing_keywords:
-            print(f"✗ Missing expected keywords: {', '.join(missing_keywords)}")
+            print(f"✗ Missing expected keywords: {', '.join(missing_keywords)}", file=out)
     
     return exit_code != 0  # Return True if command failed as expected
 
+def run_scenario(scenario: Tuple[str, List[str], List[str]]) -> Tuple[Optional[bool], str]:
+    """Run one scenario with its report buffered so parallel runs don't interleave.
+
+    Returns (success, report); success is None if the scenario itself raised.
+    """
+    description, command, expected_keywords = scenario
+    buffer = io.StringIO()
+    try:
+        success = test_error_scenario(description, command, expected_keywords, out=buffer)
+    except Exception as e:
+        buffer.write(f"❌ ERROR: {e}\n")
+        success = None
+    return success, buffer.getvalue()
+
 def main():
     """Run comprehensive error handling tests."""
     print("Jira CLI Enhanced Error Handling Test Suite")
@@ -213,18 +271,22 @@ def main():
     passed = 0
     failed = 0
     
-    for description, command, expected_keywords in test_scenarios:
-        try:
-            success = test_error_scenario(description, command, expected_keywords)
-            if success:
-                passed += 1
-                print("✅ PASSED")
-            else:
-                failed += 1
-                print("❌ FAILED")
-        except Exception as e:
-            failed += 1
-            print(f"❌ ERROR: {e}")
+    # Scenarios are independent, so run them in parallel and
+    # print the buffered reports in scenario order
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for success, report in executor.map(run_scenario, test_scenarios):
+                sys.stdout.write(report)
+                if success:
+                    passed += 1
+                    print("✅ PASSED")
+                elif success is None:
+                    failed += 1
+                else:
+                    failed += 1
+                    print("❌ FAILED")
+    finally:
+        close_runners()
     
     # Final summary
     print(f"\n{'='*60}")
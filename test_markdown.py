@@ -1,61 +1,40 @@
 #!/usr/bin/env python3
-"""Simple test script to verify markdown to ADF conversion."""
+"""Tests for markdown to ADF conversion."""
 
+import copy
 import sys
 import json
-from pathlib import Path
 
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+import pytest
 
-from jira_cli.utils.markdown_to_adf import markdown_to_adf, text_to_adf
+from jira_cli.utils.markdown_to_adf import (
+    _MD_META_RE,
+    _RENDERER,
+    _get_parser,
+    markdown_to_adf,
+)
 
 
-def test_markdown_to_adf():
-    """Test basic markdown to ADF conversion."""
-    print("Testing Markdown to ADF Conversion...")
-    
-    # Test cases
-    test_cases = [
-        {
-            "name": "Simple paragraph",
-            "markdown": "This is a simple paragraph.",
-            "expected_type": "doc"
-        },
-        {
-            "name": "Heading",
-            "markdown": "# Main Title\n\nThis is content under the heading.",
-            "expected_type": "doc"
-        },
-        {
-            "name": "Bold and italic",
-            "markdown": "This has **bold text** and *italic text*.",
-            "expected_type": "doc"
-        },
-        {
-            "name": "Code block",
-            "markdown": "```python\nprint('Hello, World!')\n```",
-            "expected_type": "doc"
-        },
-        {
-            "name": "Inline code",
-            "markdown": "Use the `print()` function to output text.",
-            "expected_type": "doc"
-        },
-        {
-            "name": "List",
-            "markdown": "- Item 1\n- Item 2\n- Item 3",
-            "expected_type": "doc"
-        },
-        {
-            "name": "Link",
-            "markdown": "Check out [Google](https://google.com) for search.",
-            "expected_type": "doc"
-        },
-        {
-            "name": "Mixed content",
-            "markdown": """# Project Update
+@pytest.mark.parametrize(
+    "markdown, expected_type",
+    [
+        pytest.param("This is a simple paragraph.", "doc", id="simple-paragraph"),
+        pytest.param(
+            "# Main Title\n\nThis is content under the heading.", "doc", id="heading"
+        ),
+        pytest.param(
+            "This has **bold text** and *italic text*.", "doc", id="bold-and-italic"
+        ),
+        pytest.param("```python\nprint('Hello, World!')\n```", "doc", id="code-block"),
+        pytest.param(
+            "Use the `print()` function to output text.", "doc", id="inline-code"
+        ),
+        pytest.param("- Item 1\n- Item 2\n- Item 3", "doc", id="list"),
+        pytest.param(
+            "Check out [Google](https://google.com) for search.", "doc", id="link"
+        ),
+        pytest.param(
+            """# Project Update
 
 This is an **important** update about our project.
 
@@ -71,72 +50,120 @@ git commit -m "Add new features"
 
 > Remember to test everything before deployment!
 """,
-            "expected_type": "doc"
-        }
+            "doc",
+            id="mixed-content",
+        ),
+    ],
+)
+def test_markdown_to_adf(markdown, expected_type):
+    """Test basic markdown to ADF conversion."""
+    result = markdown_to_adf(markdown)
+
+    assert result["type"] == expected_type
+    assert "version" in result, "Missing version field"
+    assert "content" in result, "Missing content field"
+    assert isinstance(result["content"], list), "Content should be a list"
+
+
+def test_nested_list_rendered_once():
+    """Test that nested lists only appear inside their parent item."""
+    result = markdown_to_adf("- Item 1\n  - Nested\n- Item 2")
+
+    assert len(result["content"]) == 1
+    outer = result["content"][0]
+    assert outer["type"] == "bulletList"
+    assert outer["content"][0]["content"][1]["type"] == "bulletList"
+
+
+def test_inline_html_tags_dropped():
+    """Test that inline HTML renders its text without the tags."""
+    result = markdown_to_adf("Press <kbd>Ctrl</kbd> now")
+
+    paragraph = result["content"][0]
+    assert paragraph["type"] == "paragraph"
+    assert "".join(node["text"] for node in paragraph["content"]) == (
+        "Press Ctrl now"
+    )
+
+
+def test_plain_text_fast_path():
+    """Test that short plain text matches what the parser would produce."""
+    assert markdown_to_adf(" LGTM, ship it ")["content"] == [
+        {"type": "paragraph", "content": [{"type": "text", "text": "LGTM, ship it"}]}
     ]
-    
-    success_count = 0
-    
-    for i, test_case in enumerate(test_cases, 1):
-        try:
-            print(f"\n{i}. Testing: {test_case['name']}")
-            print(f"   Markdown: {repr(test_case['markdown'][:50])}...")
-            
-            result = markdown_to_adf(test_case['markdown'])
-            
-            # Basic validation
-            assert result['type'] == test_case['expected_type'], f"Expected type {test_case['expected_type']}, got {result['type']}"
-            assert 'version' in result, "Missing version field"
-            assert 'content' in result, "Missing content field"
-            assert isinstance(result['content'], list), "Content should be a list"
-            
-            print(f"   ✓ SUCCESS - Generated {len(result['content'])} content blocks")
-            success_count += 1
-            
-        except Exception as e:
-            print(f"   ✗ FAILED - {str(e)}")
-    
-    print(f"\n=== Results ===")
-    print(f"Passed: {success_count}/{len(test_cases)} tests")
-    
-    if success_count == len(test_cases):
-        print("🎉 All tests passed!")
-        return True
-    else:
-        print("❌ Some tests failed!")
-        return False
-
-
-def demo_adf_output():
-    """Show example ADF output."""
-    print("\n" + "="*50)
-    print("DEMO: ADF Output Examples")
-    print("="*50)
-    
-    examples = [
-        "# Epic: User Authentication\n\nImplement secure user authentication system.",
-        "## Story: Login Form\n\n- Create login UI\n- Add form validation\n- **Priority**: High",
-        "### Sub-task: Backend API\n\n```javascript\n// Login endpoint\napp.post('/login', (req, res) => {\n  // TODO: implement\n});\n```"
+    # Markup without obvious emphasis characters still goes through the parser
+    assert markdown_to_adf("1. First")["content"][0]["type"] == "orderedList"
+    assert markdown_to_adf("    code")["content"][0]["type"] == "codeBlock"
+    assert markdown_to_adf("+ Item")["content"][0]["type"] == "bulletList"
+
+
+def test_plain_text_fast_path_paragraphs():
+    """Test that multi-paragraph plain text keeps paragraphs and soft breaks."""
+    markdown = "Looks good.\nThanks\n\n \nMerging now."
+    assert _MD_META_RE.search(markdown) is None
+
+    result = markdown_to_adf(markdown)
+
+    assert result["content"] == [
+        {
+            "type": "paragraph",
+            "content": [
+                {"type": "text", "text": "Looks good."},
+                {"type": "text", "text": " "},
+                {"type": "text", "text": "Thanks"},
+            ],
+        },
+        {"type": "paragraph", "content": [{"type": "text", "text": "Merging now."}]},
     ]
-    
-    for i, example in enumerate(examples, 1):
-        print(f"\nExample {i}:")
-        print(f"Markdown:\n{example}")
-        print("\nADF Output:")
-        result = markdown_to_adf(example)
-        print(json.dumps(result, indent=2))
-        print("-" * 30)
+    tokens, state = _get_parser().parse(markdown)
+    assert result == _RENDERER.finalize_data(_RENDERER.render_tokens(tokens, state))
+    # Setext underlines and hard breaks still go through the parser
+    assert markdown_to_adf("Title\n===")["content"][0]["type"] == "heading"
+    assert markdown_to_adf("a  \nb")["content"][0]["content"][1]["text"] == "\n"
+    # So does non-ASCII whitespace, which the parser strips at line starts
+    assert markdown_to_adf("Looks good\n\xa0thanks")["content"][0]["content"][2] == (
+        {"type": "text", "text": "thanks"}
+    )
+
+
+def test_converted_nodes_not_shared():
+    """Test that editing one converted document affects no other output."""
+    markdown = "**Status:** `done`, see [docs](https://example.com) *now*"
+    expected = copy.deepcopy(markdown_to_adf(markdown))
+
+    for node in markdown_to_adf(markdown)["content"][0]["content"]:
+        node["text"] = "X"
+        for mark in node.get("marks", ()):
+            mark["type"] = "X"
+            mark.get("attrs", {})["href"] = "X"
+
+    assert markdown_to_adf(markdown) == expected
+    assert "marks" not in markdown_to_adf("Status:")["content"][0]["content"][0]
+
+
+def test_break_nodes_not_shared():
+    """Test that editing a break node in one document affects no other output."""
+    markdown_to_adf("a\nb  \nc")["content"][0]["content"][1]["text"] = "X"
+    markdown_to_adf("a\nb  \nc")["content"][0]["content"][3]["text"] = "X"
+    markdown_to_adf("Looks good\nthanks")["content"][0]["content"][1]["text"] = "X"
+
+    content = markdown_to_adf("a\nb  \nc")["content"][0]["content"]
+    assert (content[1]["text"], content[3]["text"]) == (" ", "\n")
+    assert markdown_to_adf("Looks good\nthanks")["content"][0]["content"][1] == {
+        "type": "text",
+        "text": " ",
+    }
+
+
+def test_empty_placeholders_not_shared():
+    """Test that editing an empty document's placeholder affects no other output."""
+    markdown_to_adf("")["content"][0]["content"].append(
+        {"type": "text", "text": "LEAK"}
+    )
+
+    assert "LEAK" not in json.dumps(markdown_to_adf(""))
+    assert "LEAK" not in json.dumps(markdown_to_adf("| a |\n|---|\n|  |"))
 
 
 if __name__ == "__main__":
-    print("Jira CLI Markdown to ADF Test")
-    print("=" * 40)
-    
-    # Run tests
-    success = test_markdown_to_adf()
-    
-    # Show demo if tests pass
-    if success:
-        demo_adf_output()
-    
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for the validation decorators."""
+
+import sys
+
+import pytest
+import typer
+
+from jira_cli.exceptions import JiraCliError
+from jira_cli.utils.validation import (
+    handle_errors,
+    validate_choice,
+    validate_command,
+    validate_issue_key,
+    validate_required,
+)
+
+
+class _Commands:
+    @validate_command(issue_key_params=["issue_key"])
+    def get(self, issue_key=None):
+        """Get an issue."""
+        return type(self).__name__, issue_key
+
+    @validate_issue_key()
+    def watch(self, issue_key=None):
+        """Watch an issue."""
+        return type(self).__name__, issue_key
+
+
+def test_decorators_work_on_methods():
+    """Test that decorated methods are bound and still validate."""
+    commands = _Commands()
+
+    assert commands.get(issue_key="ab-1") == ("_Commands", "AB-1")
+    assert commands.watch(issue_key="ab-1") == ("_Commands", "AB-1")
+    assert _Commands.get.__module__ == __name__
+    assert _Commands.get.__doc__ == "Get an issue."
+    with pytest.raises(typer.Exit):
+        commands.get(issue_key="bad")
+
+
+def test_required_parameter_passed_as_none_is_reported(capsys):
+    """Test that an explicit None for a required parameter is an error."""
+
+    @validate_required(["summary"], command_context="issues create")
+    def create(summary=None):
+        return summary
+
+    with pytest.raises(JiraCliError):
+        create(summary=None)
+    assert "Missing Required Parameter" in capsys.readouterr().out
+
+
+def test_required_parameter_absent_is_skipped():
+    """Test that a required parameter not passed by keyword is not checked."""
+
+    @validate_required(["summary"])
+    def create(summary=None):
+        return summary
+
+    assert create() is None
+
+
+@pytest.mark.parametrize("value", ["", None])
+def test_falsy_optional_values_are_skipped(value):
+    """Test that empty emails, dates and times are passed through unchecked."""
+
+    @validate_command(
+        email_params=["email"], date_params=["due_date"], time_params=["time_spent"]
+    )
+    def update(email=None, due_date=None, time_spent=None):
+        return email, due_date, time_spent
+
+    assert update(email=value, due_date=value, time_spent=value) == (
+        value,
+        value,
+        value,
+    )
+
+
+def test_choice_parameter(capsys):
+    """Test that valid choices pass and invalid ones keep their error message."""
+
+    @validate_choice("priority", ["High", "Low"], command_context="issues create")
+    def create(priority=None):
+        return priority
+
+    assert create(priority="High") == "High"
+    with pytest.raises(JiraCliError):
+        create(priority="Urgent")
+    assert capsys.readouterr().out == (
+        "Error: Invalid Parameter Value\n"
+        "The value 'Urgent' is not valid for parameter 'priority'.\n"
+        "\n"
+        "Received: 'Urgent'\n"
+        "Expected: One of: High, Low\n"
+        "\n"
+        "Example usage:\n"
+        "  --priority High\n"
+        "  --priority Low\n"
+        "\n"
+        "Suggestions:\n"
+        "  - Use one of the valid choices listed above\n"
+        "\n"
+        "Run 'jira-cli issues create --help' for more information.\n"
+    )
+
+
+def test_handle_errors_exits_on_reported_validation_failure(capsys):
+    """Test that handle_errors exits without reporting the failure again."""
+
+    @handle_errors()
+    @validate_issue_key()
+    def get(issue_key=None):
+        return issue_key
+
+    with pytest.raises(typer.Exit) as excinfo:
+        get(issue_key="bad")
+    assert excinfo.value.exit_code == 1
+    assert capsys.readouterr().out.count("Error:") == 1
+
+
+def test_positional_arguments_are_not_validated():
+    """Test that only keyword arguments are validated, as Typer passes them."""
+
+    @validate_command(issue_key_params=["issue_key"], required_params=["summary"])
+    def create(issue_key=None, summary=None):
+        return issue_key, summary
+
+    assert create("bad", None) == ("bad", None)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))